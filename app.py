@@ -1,13 +1,17 @@
 import os
+import logging
+import threading
+from typing import Any, Dict
 import streamlit as st
 from dotenv import load_dotenv
 
-from services.ingestion import load_table_file
-from services.document_builder import build_product_document
+# chromadb ve langchain_google_genai bu modüllerin içinde ilk kullanımda yüklenir
 from services.rag import make_product_id, index_documents_to_chroma_with_embeddings
-from services.rag import semantic_search_in_chroma
-from services.llm import generate_answer
-from utils.validators import validate_required_columns
+from services.rag import semantic_search_in_chroma, warmup_collection
+from services.llm import generate_answer, get_chat_model
+from services.embeddings import get_embeddings_model
+
+logger = logging.getLogger(__name__)
 
 
 def ensure_directories() -> None:
@@ -15,6 +19,33 @@ def ensure_directories() -> None:
     os.makedirs("db", exist_ok=True)
 
 
+def warmup_query_pipeline(state: Dict[str, Any]) -> None:
+    # Chroma collection + HNSW index'ini ve Gemini client'larının import'larını önceden yükler
+    is_ok, message = warmup_collection(persist_dir="db", collection_name="cosmetics_kb")
+    state["collection"] = (is_ok, message)  # Sonuç cache'lenen nesnede incelenebilir
+
+    if not is_ok:
+        logger.warning("Warmup başarısız, ilk soru cold-start maliyetini ödeyecek: %s", message)
+
+    for factory in (get_embeddings_model, get_chat_model):
+        try:
+            factory()
+        except ValueError:
+            pass  # API key yoksa hata ilk soruda kullanıcıya gösterilir
+        except Exception as exc:
+            logger.warning("Gemini client ısınması başarısız: %s", exc)
+
+
+@st.cache_resource(show_spinner=False)
+def start_warmup() -> Dict[str, Any]:
+    # cache_resource sayesinde process başına tek sefer çalışır (rerun'larda tekrar başlamaz)
+    state: Dict[str, Any] = {"collection": None}  # Thread bitince (is_ok, message) yazılır
+    thread = threading.Thread(target=warmup_query_pipeline, args=(state,), name="rag-warmup", daemon=True)
+    state["thread"] = thread
+    thread.start()
+    return state
+
+
 def save_uploaded_file(uploaded_file) -> str:
     file_path = os.path.join("data/uploads", uploaded_file.name)
     with open(file_path, "wb") as f:
@@ -106,12 +137,21 @@ def render_admin_tab() -> None:
     st.subheader("Admin")
     st.caption("Yeni XLSX yükleyip ürün KB’yi indexleyebilirsin.")
 
+    warmup_result = start_warmup()["collection"]
+    if warmup_result is not None and not warmup_result[0]:
+        st.warning(warmup_result[1])  # Başarısız ısınmayı Admin'e gösterir
+
     uploaded_file = st.file_uploader("XLSX dosyası yükle", type=["xlsx"])
 
     if uploaded_file is None:
         st.info("Indexlemek için XLSX yükle.")
         return
 
+    # Ingestion stack'i (pandas vb.) sadece Admin gerçekten kullanıldığında yüklenir
+    from services.ingestion import load_table_file
+    from services.document_builder import build_product_document
+    from utils.validators import validate_required_columns
+
     saved_path = save_uploaded_file(uploaded_file)
 
     is_ok, message, df = load_table_file(saved_path)
@@ -170,6 +210,7 @@ def render_admin_tab() -> None:
 def main() -> None:
     load_dotenv()
     ensure_directories()
+    start_warmup()
 
     st.set_page_config(page_title="Cosmetic RAG Assistant", layout="wide")
     st.title("Cosmetic RAG Assistant")
@@ -2,9 +2,10 @@ from __future__ import annotations  # Tip ipuçlarında ileri referans için
 
 import os  # Ortam değişkeninden API key okumak için
 
-from typing import List  # Liste tipini açık yazmak için
+from typing import TYPE_CHECKING, List  # Liste tipini açık yazmak için
 
-from langchain_google_genai import GoogleGenerativeAIEmbeddings  # Gemini embeddings modeli için
+if TYPE_CHECKING:
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings  # Sadece tip kontrolü için
 
 
 def get_embeddings_model() -> GoogleGenerativeAIEmbeddings:
@@ -19,6 +20,8 @@ def get_embeddings_model() -> GoogleGenerativeAIEmbeddings:
     if not api_key:
         raise ValueError("GOOGLE_API_KEY bulunamadı. .env dosyasını doldurmalısın.")  # Key yoksa net hata verir
 
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings  # Ağır import, ilk kullanımda yüklenir
+
     model = GoogleGenerativeAIEmbeddings(
         model="models/text-embedding-004",  # Gemini embedding modeli adı
         google_api_key=api_key,  # API key'i modele verir
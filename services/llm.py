@@ -1,9 +1,10 @@
 from __future__ import annotations  # Tip ipuçlarında ileri referans için
 
 import os  # API key okumak için
-from typing import List  # Liste tipini açık yazmak için
+from typing import TYPE_CHECKING, List  # Liste tipini açık yazmak için
 
-from langchain_google_genai import ChatGoogleGenerativeAI  # Gemini chat modeli için
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI  # Sadece tip kontrolü için
 
 
 def get_chat_model() -> ChatGoogleGenerativeAI:
@@ -18,6 +19,8 @@ def get_chat_model() -> ChatGoogleGenerativeAI:
     if not api_key:
         raise ValueError("GOOGLE_API_KEY bulunamadı. .env dosyasını doldurmalısın.")  # Key yoksa net hata
 
+    from langchain_google_genai import ChatGoogleGenerativeAI  # Ağır import, ilk kullanımda yüklenir
+
     llm = ChatGoogleGenerativeAI(
         model="gemini-2.5-flash",  # Hızlı ve uygun maliyetli model
         google_api_key=api_key,  # API key
@@ -1,11 +1,82 @@
 from __future__ import annotations  # Tip ipuçlarında ileri referans için
 
 import hashlib  # Stabil id üretmek için hash kullanacağız
+import os  # Cache anahtarında klasör yolunu normalize etmek için
+import threading  # Collection cache'ini Streamlit thread'leri arasında korumak için
 from typing import Any, Dict, List, Tuple  # Tipleri açık yazmak için
 
-import chromadb  # ChromaDB client kullanmak için
 from services.embeddings import embed_query, embed_texts  # Gemini embedding üretmek için
 
+_COLLECTION_CACHE: Dict[Tuple[str, str], Any] = {}  # (persist_dir, collection_name) -> collection
+_COLLECTION_LOCK = threading.Lock()  # Aynı collection'ın iki kez açılmasını önler
+
+
+def get_collection(persist_dir: str = "db", collection_name: str = "cosmetics_kb") -> Any:
+    """
+    Chroma collection'ını process boyunca tek sefer açar ve tekrar kullanır.
+    chromadb ağır bir import olduğu için ilk çağrıda yüklenir.
+
+    Args:
+        persist_dir: Chroma persist klasörü.
+        collection_name: Collection adı.
+
+    Returns:
+        Chroma collection nesnesi.
+    """
+    key = (os.path.abspath(persist_dir), collection_name)  # Aynı klasör farklı yazımlarla gelebilir
+
+    with _COLLECTION_LOCK:
+        collection = _COLLECTION_CACHE.get(key)  # Daha önce açıldıysa onu döndürür
+
+        if collection is None:
+            import chromadb  # ChromaDB client kullanmak için (lazy)
+
+            client = chromadb.PersistentClient(path=persist_dir)  # Persist edilen DB'ye bağlanır
+            collection = client.get_or_create_collection(name=collection_name)  # Collection'ı alır
+            _COLLECTION_CACHE[key] = collection  # Sonraki çağrılar için saklar
+
+        return collection
+
+
+def _forget_collection(persist_dir: str, collection_name: str) -> None:
+    """Silinen/yeniden oluşturulan collection'ın eski nesnesini cache'ten çıkarır."""
+    with _COLLECTION_LOCK:
+        _COLLECTION_CACHE.pop((os.path.abspath(persist_dir), collection_name), None)
+
+
+def warmup_collection(persist_dir: str = "db", collection_name: str = "cosmetics_kb") -> Tuple[bool, str]:
+    """
+    Collection'ı açar ve HNSW index'ini belleğe yükletir.
+    Chroma vektör index'ini ilk sorguda diskten okur; kayıtlı bir embedding ile yapılan
+    tek bir sorgu bu maliyeti kullanıcının ilk sorusundan önce öder.
+
+    Args:
+        persist_dir: Chroma persist klasörü.
+        collection_name: Collection adı.
+
+    Returns:
+        (is_ok, message)
+    """
+    try:
+        collection = get_collection(persist_dir=persist_dir, collection_name=collection_name)  # Client + collection
+
+        sample = collection.get(limit=1, include=["embeddings"])  # Index boyutuna uygun örnek vektör
+        embeddings = sample.get("embeddings")
+
+        if embeddings is None or len(embeddings) == 0:
+            return True, "Collection boş, HNSW ısınması atlandı."  # Henüz indexleme yapılmamış
+
+        collection.query(
+            query_embeddings=[list(embeddings[0])],  # Mevcut bir vektörle sorgu
+            n_results=1,  # Sadece index'in yüklenmesi için
+            include=["distances"],  # Doküman/metadata okumaya gerek yok
+        )  # HNSW index'ini yükler
+
+        return True, f"Collection hazır. Toplam doküman: {collection.count()}"
+
+    except Exception as exc:
+        return False, f"Collection ısınması başarısız: {exc}"
+
 
 def make_product_id(row: Dict[str, Any]) -> str:
     """
@@ -48,6 +119,8 @@ def index_documents_to_chroma(
         (is_ok, message) sonucu.
     """
     try:
+        import chromadb  # ChromaDB client kullanmak için (lazy)
+
         client = chromadb.PersistentClient(path=persist_dir)  # Chroma'yı disk üzerinde persist edecek client
         
         try:
@@ -55,8 +128,9 @@ def index_documents_to_chroma(
         except Exception:
             pass  # Collection yoksa veya silinemezse hata vermesin
 
+        _forget_collection(persist_dir, collection_name)  # Cache'teki silinmiş collection kullanılmasın
 
-        collection = client.get_or_create_collection(name=collection_name)  # Tek collection kullanır
+        collection = get_collection(persist_dir=persist_dir, collection_name=collection_name)  # Tek collection kullanır
 
         collection.add(
             documents=documents,  # Metin dokümanları
@@ -90,8 +164,7 @@ def search_documents_in_chroma(
             results: Her eleman {"id":..., "document":..., "metadata":...} içerir.
     """
     try:
-        client = chromadb.PersistentClient(path=persist_dir)  # Persist edilen DB'ye bağlanır
-        collection = client.get_or_create_collection(name=collection_name)  # Collection'ı alır
+        collection = get_collection(persist_dir=persist_dir, collection_name=collection_name)  # Collection'ı alır
 
         # where_document metin içinde arama yapar (embedding olmadan çalışır)
         res = collection.get(
@@ -148,8 +221,7 @@ def index_documents_to_chroma_with_embeddings(
     try:
         vectors = embed_texts(documents)  # Tüm dokümanları embedding'e çevirir
 
-        client = chromadb.PersistentClient(path=persist_dir)  # Persist client
-        collection = client.get_or_create_collection(name=collection_name)  # Collection alır
+        collection = get_collection(persist_dir=persist_dir, collection_name=collection_name)  # Collection alır
 
         collection.delete(ids=ids)  # Aynı id varsa temizler
 
@@ -186,8 +258,7 @@ def semantic_search_in_chroma(
     try:
         q_vec = embed_query(query_text)  # Sorguyu embedding'e çevirir
 
-        client = chromadb.PersistentClient(path=persist_dir)  # Persist DB
-        collection = client.get_or_create_collection(name=collection_name)  # Collection
+        collection = get_collection(persist_dir=persist_dir, collection_name=collection_name)  # Collection (cache'li)
 
         res = collection.query(
             query_embeddings=[q_vec],  # Sorgu embedding listesi
@@ -0,0 +1,82 @@
+from __future__ import annotations  # Tip ipuçlarında ileri referans için
+
+import json  # .jsonl korpusu yazmak için
+
+import pytest
+
+from tools.load_test import build_report, load_queries, percentile
+
+
+def _record(total_s: float, ok: bool, error_kind: str | None = None) -> dict:
+    """build_report'un beklediği alanlarla sahte istek kaydı üretir."""
+    return {
+        "ok": ok,
+        "error_kind": error_kind,
+        "total_s": total_s,
+        "service_s": total_s,
+        "queue_s": 0.0,
+        "retrieval_s": 0.01,
+        "generation_s": total_s - 0.01 if ok else None,
+    }
+
+
+def test_load_queries_jsonl_keeps_only_user_turns(tmp_path):
+    path = tmp_path / "session.jsonl"
+    lines = [
+        {"role": "user", "content": "Kuru cilt için krem?"},
+        {"role": "assistant", "content": "Bu öneriler yüklenen ürün KB içeriğine dayanır..."},
+        {"role": "system", "content": "sistem mesajı"},
+        {"query": "Yağlı cilt için tonik?"},
+        {"role": "user", "content": "   "},
+    ]
+    path.write_text("\n".join(json.dumps(x, ensure_ascii=False) for x in lines), encoding="utf-8")
+
+    assert load_queries(str(path)) == ["Kuru cilt için krem?", "Yağlı cilt için tonik?"]
+
+
+def test_load_queries_text_skips_comments_and_blank_lines(tmp_path):
+    path = tmp_path / "queries.txt"
+    path.write_text("# yorum\n\nMerhaba\n  Serum önerir misin?  \n", encoding="utf-8")
+
+    assert load_queries(str(path)) == ["Merhaba", "Serum önerir misin?"]
+
+
+def test_load_queries_rejects_corpus_with_only_assistant_turns(tmp_path):
+    path = tmp_path / "session.jsonl"
+    path.write_text(json.dumps({"role": "assistant", "content": "cevap"}), encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        load_queries(str(path))
+
+
+def test_percentile_interpolates_between_values():
+    values = [1.0, 2.0, 3.0, 4.0]
+
+    assert percentile(values, 0) == 1.0
+    assert percentile(values, 50) == pytest.approx(2.5)
+    assert percentile(values, 90) == pytest.approx(3.7)
+    assert percentile(values, 100) == 4.0
+
+
+def test_percentile_edge_cases():
+    assert percentile([], 95) == 0.0
+    assert percentile([0.7], 50) == 0.7
+    assert percentile([0.7], 99) == 0.7
+
+
+def test_build_report_all_requests_include_failures():
+    records = [
+        _record(0.1, ok=True),
+        _record(0.2, ok=True),
+        _record(5.0, ok=False, error_kind="generation:FakeGeminiError"),  # Yavaş hata (timeout benzeri)
+    ]
+
+    report = build_report(records, timeline=[], wall_s=1.0, config={})
+    latency = report["summary"]["latency_s"]
+
+    assert latency["all_requests"]["total"]["count"] == 3
+    assert latency["all_requests"]["total"]["max"] == 5.0
+    assert latency["ok_requests"]["total"]["count"] == 2
+    assert latency["ok_requests"]["total"]["max"] == 0.2
+    assert report["summary"]["error_rate"] == pytest.approx(1 / 3, abs=1e-4)
+    assert report["errors_by_type"] == {"generation:FakeGeminiError": 1}
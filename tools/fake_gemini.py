@@ -0,0 +1,145 @@
+from __future__ import annotations  # Tip ipuçlarında ileri referans için
+
+import hashlib  # Metinden deterministik seed üretmek için
+import math  # Lognormal dağılım parametreleri için
+import random  # Gecikme ve vektör üretimi için
+import threading  # Paylaşılan rastgele üreteci thread-safe kullanmak için
+import time  # Gecikmeyi simüle etmek için
+from dataclasses import dataclass  # Basit konfigürasyon nesneleri için
+from typing import Callable, List  # Tipleri açık yazmak için
+
+import services.embeddings as embeddings_module  # Embedding modeli fabrikasını değiştirmek için
+import services.llm as llm_module  # Chat modeli fabrikasını değiştirmek için
+
+EMBEDDING_DIM = 768  # text-embedding-004 ile aynı boyut (Chroma collection'ı uyumlu kalsın)
+
+
+class FakeGeminiError(RuntimeError):
+    """Sahte Gemini modellerinin enjekte ettiği hata tipi."""
+
+
+@dataclass
+class LatencyModel:
+    """
+    Gerçekçi API gecikmesi için lognormal dağılım.
+    Gerçek API gecikmeleri sağa çarpık olduğu için ortalama yerine medyan + sigma ile tanımlanır.
+
+    Args:
+        median_s: Medyan gecikme (saniye).
+        sigma: Lognormal dağılımın şekil parametresi (büyüdükçe kuyruk uzar).
+        error_rate: Çağrının hata fırlatma olasılığı (0-1 arası).
+        max_s: Tek çağrı için üst sınır (timeout benzeri).
+    """
+
+    median_s: float
+    sigma: float = 0.4
+    error_rate: float = 0.0
+    max_s: float = 30.0
+
+    def __post_init__(self) -> None:
+        self._rng = random.Random()  # Her model kendi üretecini kullanır
+        self._lock = threading.Lock()  # random.Random thread-safe olmadığı için kilit
+
+    def seed(self, value: int) -> None:
+        with self._lock:
+            self._rng.seed(value)  # Tekrarlanabilir koşular için seed verir
+
+    def sample(self) -> float:
+        with self._lock:
+            value = self._rng.lognormvariate(math.log(self.median_s), self.sigma)  # Lognormal örnek
+        return min(value, self.max_s)  # Üst sınırı uygular
+
+    def should_fail(self) -> bool:
+        if self.error_rate <= 0:
+            return False  # Hata enjeksiyonu kapalı
+        with self._lock:
+            return self._rng.random() < self.error_rate  # Olasılığa göre hata üretir
+
+    def wait(self, label: str) -> None:
+        """Gecikmeyi uygular, gerekirse hata fırlatır."""
+        time.sleep(self.sample())  # API çağrısını simüle eder (GIL'i bırakır, gerçek I/O gibi)
+        if self.should_fail():
+            raise FakeGeminiError(f"Sahte {label} hatası (enjekte edildi)")  # Hata senaryosu
+
+
+def _deterministic_vector(text: str) -> List[float]:
+    """
+    Metinden deterministik, normalize edilmiş bir vektör üretir.
+    Aynı metin her zaman aynı vektörü verir; böylece retrieval sonuçları tekrarlanabilir olur.
+    """
+    seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")  # Metinden seed
+    rng = random.Random(seed)  # Metne özel üreteç
+    values = [rng.gauss(0.0, 1.0) for _ in range(EMBEDDING_DIM)]  # Rastgele bileşenler
+    norm = math.sqrt(sum(v * v for v in values)) or 1.0  # Sıfıra bölmeyi önler
+    return [v / norm for v in values]  # Birim vektör döndürür
+
+
+class FakeEmbeddings:
+    """GoogleGenerativeAIEmbeddings yerine geçen yerel embedding modeli."""
+
+    def __init__(self, latency: LatencyModel) -> None:
+        self.latency = latency  # Çağrı başına gecikme modeli
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.latency.wait("embedding")  # Toplu çağrı tek istek gibi davranır
+        return [_deterministic_vector(t) for t in texts]  # Her metin için vektör
+
+    def embed_query(self, text: str) -> List[float]:
+        self.latency.wait("embedding")  # Sorgu embedding gecikmesi
+        return _deterministic_vector(text)  # Sorgu vektörü
+
+
+@dataclass
+class FakeChatResponse:
+    """ChatGoogleGenerativeAI cevabının sadece kullanılan alanını taklit eder."""
+
+    content: str
+
+
+class FakeChatModel:
+    """
+    ChatGoogleGenerativeAI yerine geçen yerel chat modeli.
+    Gecikme, prompt uzunluğuyla (bağlam boyutu) hafifçe artar.
+    """
+
+    def __init__(self, latency: LatencyModel, per_1k_chars_s: float = 0.02) -> None:
+        self.latency = latency  # Temel gecikme modeli
+        self.per_1k_chars_s = per_1k_chars_s  # Prompt boyutuna bağlı ek gecikme
+
+    def invoke(self, prompt: str) -> FakeChatResponse:
+        time.sleep(len(prompt) / 1000 * self.per_1k_chars_s)  # Uzun bağlam = biraz daha yavaş
+        self.latency.wait("LLM")  # Temel üretim gecikmesi
+        return FakeChatResponse(content=f"[sahte cevap] prompt uzunluğu: {len(prompt)} karakter")
+
+
+def install_fake_gemini(
+    embed_latency: LatencyModel,
+    llm_latency: LatencyModel,
+    llm_per_1k_chars_s: float = 0.02,
+) -> Callable[[], None]:
+    """
+    services.embeddings ve services.llm içindeki model fabrikalarını sahte modellerle değiştirir.
+    Pipeline kodu (semantic_search_in_chroma, generate_answer) olduğu gibi çalışır; sadece Gemini çağrıları yereldir.
+
+    Args:
+        embed_latency: Embedding çağrıları için gecikme modeli.
+        llm_latency: LLM çağrıları için gecikme modeli.
+        llm_per_1k_chars_s: Prompt'un her 1000 karakteri için LLM'e eklenen gecikme (0: kapalı).
+
+    Returns:
+        Orijinal fabrikaları geri yükleyen fonksiyon.
+    """
+    original_embeddings = embeddings_module.get_embeddings_model  # Geri yüklemek için saklar
+    original_chat = llm_module.get_chat_model  # Geri yüklemek için saklar
+
+    fake_embeddings = FakeEmbeddings(embed_latency)  # Tek örnek yeterli (durumsuz)
+    fake_chat = FakeChatModel(llm_latency, per_1k_chars_s=llm_per_1k_chars_s)  # Tek örnek yeterli (durumsuz)
+
+    embeddings_module.get_embeddings_model = lambda: fake_embeddings  # Embedding fabrikasını değiştirir
+    llm_module.get_chat_model = lambda: fake_chat  # Chat fabrikasını değiştirir
+
+    def restore() -> None:
+        embeddings_module.get_embeddings_model = original_embeddings  # Orijinali geri koyar
+        llm_module.get_chat_model = original_chat  # Orijinali geri koyar
+
+    return restore
@@ -0,0 +1,636 @@
+"""
+Sorgu pipeline'ı (semantic_search_in_chroma + generate_answer) için yük testi.
+
+Streamlit her kullanıcı oturumunu aynı process içinde ayrı bir thread'de çalıştırır;
+bu yüzden yük, tek process içinde thread havuzu ile üretilir.
+
+Örnek kullanım (repo kökünden):
+    python -m tools.load_test --qps 5 --concurrency 16 --duration 60
+    python -m tools.load_test --qps 0 --concurrency 8 --num-requests 200   # closed-loop (max throughput)
+    python -m tools.load_test --backend gemini --persist-dir db            # gerçek Gemini ile (maliyetli!)
+"""
+
+from __future__ import annotations  # Tip ipuçlarında ileri referans için
+
+import argparse  # Komut satırı parametreleri için
+import json  # Sonuç raporunu kaydetmek için
+import os  # Dosya yolları ve RSS ölçümü için
+import subprocess  # Raporu git commit'i ile etiketlemek için
+import threading  # Kaynak örnekleyici ve sayaçlar için
+import time  # Zamanlama için
+from concurrent.futures import ThreadPoolExecutor  # Eşzamanlı kullanıcıları simüle etmek için
+from datetime import datetime  # Rapor dosya adı için
+from typing import Any, Dict, List, Optional, Tuple  # Tipleri açık yazmak için
+
+from services.llm import generate_answer  # Cevap üretim adımı
+from services.rag import semantic_search_in_chroma  # Retrieval adımı
+
+try:
+    import resource  # Unix'te RSS için yedek ölçüm
+except ImportError:  # Windows'ta yok
+    resource = None  # type: ignore[assignment]
+
+DEFAULT_QUERIES_PATH = os.path.join(os.path.dirname(__file__), "queries_tr.txt")  # Örnek Türkçe sorgular
+DEFAULT_XLSX_PATH = os.path.join("data", "uploads", "cosmetics-data1.xlsx")  # Stub KB için kaynak veri
+
+
+def load_queries(path: str) -> List[str]:
+    """
+    Sorgu korpusunu okur. Düz metin dosyalarında her dolu satır bir sorgudur
+    (# ile başlayan satırlar atlanır).
+
+    .jsonl dosyalarında her satır bir JSON nesnesidir ve iki şema kabul edilir:
+        {"query": "..."}                       : sentetik/elle hazırlanmış sorgu
+        {"role": "user", "content": "..."}     : kayıtlı sohbet (st.session_state["messages"] formatı)
+    "role" alanı olan kayıtlardan sadece role == "user" olanlar alınır; asistan cevapları
+    sorgu olarak tekrar oynatılmaz.
+
+    Args:
+        path: Korpus dosyasının yolu.
+
+    Returns:
+        Sorgu metinleri listesi.
+    """
+    queries: List[str] = []  # Sorguları burada toplayacağız
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()  # Boşlukları temizler
+            if not line or line.startswith("#"):
+                continue  # Boş ve yorum satırlarını atlar
+
+            if path.lower().endswith(".jsonl"):
+                record = json.loads(line)  # Kayıtlı sohbet trafiği satırı
+                if "role" in record and record["role"] != "user":
+                    continue  # Asistan/sistem mesajları sorgu değildir
+                text = str(record.get("query") or record.get("content") or "").strip()
+                if text:
+                    queries.append(text)
+            else:
+                queries.append(line)  # Düz metin satırı
+
+    if not queries:
+        raise ValueError(f"Sorgu korpusu boş: {path}")  # Boş korpusla test anlamsız
+
+    return queries
+
+
+def build_stub_kb(xlsx_path: str, persist_dir: str, collection_name: str) -> Tuple[bool, str]:
+    """
+    XLSX verisinden, app.py Admin akışıyla aynı şekilde bir KB oluşturur.
+    Stub backend ile çağrıldığında embedding'ler yerel ve deterministiktir.
+
+    Args:
+        xlsx_path: Ürün verisi XLSX dosyası.
+        persist_dir: Chroma persist klasörü (gerçek db/ klasöründen ayrı tutulmalı).
+        collection_name: Collection adı.
+
+    Returns:
+        (is_ok, message)
+    """
+    from services.document_builder import build_product_document  # Sadece indexlemede gerekli
+    from services.ingestion import load_table_file  # Sadece indexlemede gerekli
+    from services.rag import index_documents_to_chroma_with_embeddings, make_product_id
+
+    is_ok, message, df = load_table_file(xlsx_path)  # XLSX'i okur
+    if not is_ok or df is None:
+        return False, message
+
+    documents: List[str] = []
+    metadatas: List[Dict[str, Any]] = []
+    ids: List[str] = []
+
+    for _, row in df.iterrows():
+        row_dict = row.to_dict()
+        product_id = make_product_id(row_dict)  # app.py ile aynı id şeması
+
+        documents.append(build_product_document(row_dict))
+        metadatas.append(
+            {
+                "product_id": product_id,
+                "name": str(row_dict.get("Name", "")).strip(),
+                "brand": str(row_dict.get("Brand", "")).strip(),
+                "label": str(row_dict.get("Label", "")).strip(),
+                "price": float(row_dict.get("Price", 0) or 0),
+                "rank": float(row_dict.get("Rank", 0) or 0),
+            }
+        )
+        ids.append(product_id)
+
+    return index_documents_to_chroma_with_embeddings(
+        documents=documents,
+        metadatas=metadatas,
+        ids=ids,
+        persist_dir=persist_dir,
+        collection_name=collection_name,
+    )
+
+
+def read_rss_mb() -> Optional[float]:
+    """
+    Process'in anlık RSS değerini MB olarak döndürür.
+    Linux'ta /proc kullanılır; diğer Unix'lerde tepe RSS (ru_maxrss) ile yetinilir.
+    """
+    try:
+        with open("/proc/self/statm", "r") as f:
+            rss_pages = int(f.read().split()[1])  # İkinci alan: resident sayfa sayısı
+        return rss_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        pass  # /proc yoksa yedek yönteme geçer
+
+    if resource is not None:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # Linux: KB, macOS: byte
+        divisor = 1024 * 1024 if os.uname().sysname == "Darwin" else 1024
+        return max_rss / divisor
+
+    return None  # Ölçülemedi
+
+
+class ResourceSampler(threading.Thread):
+    """
+    Belirli aralıklarla CPU kullanımı, RSS ve ilerleme (tamamlanan/hatalı istek) örnekler.
+    CPU yüzdesi tüm thread'lerin toplamıdır (100 = bir çekirdek).
+    """
+
+    def __init__(self, interval_s: float, stats: "RunStats") -> None:
+        super().__init__(daemon=True)
+        self.interval_s = interval_s  # Örnekleme aralığı
+        self.stats = stats  # Canlı sayaçlar
+        self.samples: List[Dict[str, Any]] = []  # Zaman serisi
+        self._stop_event = threading.Event()  # Durdurma sinyali
+
+    def run(self) -> None:
+        start_wall = time.perf_counter()
+        last_wall = start_wall
+        last_cpu = time.process_time()  # Process'in toplam CPU süresi
+        last_completed = 0
+
+        while not self._stop_event.wait(self.interval_s):
+            now_wall = time.perf_counter()
+            now_cpu = time.process_time()
+            completed, errors = self.stats.snapshot()
+
+            elapsed = now_wall - last_wall
+            self.samples.append(
+                {
+                    "t_s": round(now_wall - start_wall, 3),  # Test başından itibaren süre
+                    "cpu_percent": round((now_cpu - last_cpu) / elapsed * 100, 1) if elapsed > 0 else 0.0,
+                    "rss_mb": _round_or_none(read_rss_mb(), 1),
+                    "completed": completed,  # Kümülatif tamamlanan istek
+                    "errors": errors,  # Kümülatif hatalı istek
+                    "throughput_rps": round((completed - last_completed) / elapsed, 2) if elapsed > 0 else 0.0,
+                    "in_flight": self.stats.in_flight(),  # Şu an işlenen/kuyruktaki istek
+                }
+            )
+
+            last_wall, last_cpu, last_completed = now_wall, now_cpu, completed
+
+    def stop(self) -> None:
+        self._stop_event.set()  # Döngüyü sonlandırır
+        self.join()
+
+
+class RunStats:
+    """Worker thread'lerinin paylaştığı, kilitle korunan sayaçlar ve istek kayıtları."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.records: List[Dict[str, Any]] = []  # Her istek için ölçüm kaydı
+        self._submitted = 0
+        self._errors = 0
+
+    def mark_submitted(self) -> None:
+        with self._lock:
+            self._submitted += 1
+
+    def add(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self.records.append(record)
+            if not record["ok"]:
+                self._errors += 1
+
+    def snapshot(self) -> Tuple[int, int]:
+        with self._lock:
+            return len(self.records), self._errors
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return self._submitted - len(self.records)
+
+
+def run_one(
+    query: str,
+    scheduled_at: float,
+    persist_dir: str,
+    collection_name: str,
+    top_k: int,
+) -> Dict[str, Any]:
+    """
+    app.py Chat akışıyla aynı adımları tek bir sorgu için çalıştırır ve süreleri ölçer.
+
+    Args:
+        query: Kullanıcı sorgusu.
+        scheduled_at: İsteğin planlanan başlangıç zamanı (perf_counter). Kuyrukta bekleme süresi
+            toplam gecikmeye dahil edilir; aksi halde sistem yavaşladığında ölçüm kendini iyimser gösterir.
+        persist_dir: Chroma persist klasörü.
+        collection_name: Collection adı.
+        top_k: Retrieval sonuç sayısı.
+
+    Returns:
+        İstek ölçüm kaydı.
+    """
+    started = time.perf_counter()
+    record: Dict[str, Any] = {
+        "queue_s": started - scheduled_at,  # Worker beklerken geçen süre
+        "retrieval_s": None,
+        "generation_s": None,
+        "ok": False,
+        "error_kind": None,
+        "error": None,
+    }
+
+    is_ok, message, results = semantic_search_in_chroma(
+        query_text=query,
+        persist_dir=persist_dir,
+        collection_name=collection_name,
+        top_k=top_k,
+    )  # Hataları yakalayıp is_ok=False döndürür
+    after_retrieval = time.perf_counter()
+    record["retrieval_s"] = after_retrieval - started
+
+    if not is_ok:
+        record["error_kind"] = "retrieval"  # app.py gibi boş bağlamla devam eder ama hata sayılır
+        record["error"] = message
+
+    context_docs = [r["document"] for r in results] if is_ok else []
+
+    try:
+        generate_answer(user_question=query, context_docs=context_docs)
+        record["generation_s"] = time.perf_counter() - after_retrieval
+        record["ok"] = is_ok
+    except Exception as exc:
+        record["error_kind"] = f"generation:{type(exc).__name__}"  # generate_answer hatayı fırlatır
+        record["error"] = str(exc)
+
+    finished = time.perf_counter()
+    record["service_s"] = finished - started  # Sadece işleme süresi
+    record["total_s"] = finished - scheduled_at  # Kullanıcının gördüğü süre (kuyruk dahil)
+    record["finished_at"] = finished
+    return record
+
+
+def run_load_test(
+    queries: List[str],
+    qps: float,
+    concurrency: int,
+    duration_s: Optional[float],
+    num_requests: Optional[int],
+    persist_dir: str,
+    collection_name: str,
+    top_k: int = 5,
+    sample_interval_s: float = 1.0,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], float]:
+    """
+    Sorguları hedef QPS ve eşzamanlılıkla pipeline'a gönderir.
+
+    qps > 0 ise open-loop çalışır: istekler sabit aralıklarla planlanır, cevabı beklemez
+    (gerçek kullanıcı trafiği gibi). qps <= 0 ise closed-loop çalışır: her worker bir cevap
+    gelir gelmez yeni istek gönderir (ulaşılabilir maksimum throughput).
+
+    Args:
+        queries: Sırayla (döngüsel) gönderilecek sorgular.
+        qps: Hedef istek/saniye (<= 0: closed-loop).
+        concurrency: Aynı anda işlenebilecek en fazla istek (worker sayısı).
+        duration_s: Test süresi (saniye). num_requests ile birlikte verilirse önce dolan durdurur.
+        num_requests: Gönderilecek en fazla istek sayısı.
+        persist_dir: Chroma persist klasörü.
+        collection_name: Collection adı.
+        top_k: Retrieval sonuç sayısı.
+        sample_interval_s: Kaynak örnekleme aralığı.
+
+    Returns:
+        (records, timeline, wall_s): istek kayıtları, kaynak zaman serisi, toplam süre.
+        Ölçüm başlamadan önce yapılan ısınma sorgusu kayıtlara dahil değildir.
+    """
+    if duration_s is None and num_requests is None:
+        raise ValueError("duration_s veya num_requests verilmelidir.")  # Sonsuz test olmasın
+
+    stats = RunStats()
+    sampler = ResourceSampler(sample_interval_s, stats)
+    counter_lock = threading.Lock()
+    next_index = [0]  # Closed-loop worker'lar arasında paylaşılan sorgu sayacı
+
+    # Zamanlanmayan ısınma sorgusu: chromadb import'u, collection açılışı, HNSW yüklemesi ve
+    # embedding client'ı ölçüme girmesin; aksi halde ilk `concurrency` istek kuyruğu bozar.
+    is_ok, message, _ = semantic_search_in_chroma(
+        query_text=queries[0],
+        persist_dir=persist_dir,
+        collection_name=collection_name,
+        top_k=top_k,
+    )
+    if not is_ok:
+        print(f"Uyarı: ısınma sorgusu başarısız: {message}")
+
+    start = time.perf_counter()
+    deadline = start + duration_s if duration_s is not None else float("inf")
+    sampler.start()
+
+    def claim_index() -> Optional[int]:
+        with counter_lock:
+            i = next_index[0]
+            if num_requests is not None and i >= num_requests:
+                return None  # İstek kotası doldu
+            next_index[0] += 1
+            return i
+
+    def execute(i: int, scheduled_at: float) -> None:
+        record = run_one(queries[i % len(queries)], scheduled_at, persist_dir, collection_name, top_k)
+        record["index"] = i
+        record["started_offset_s"] = scheduled_at - start
+        stats.add(record)
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="loadtest") as executor:
+        if qps > 0:
+            interval = 1.0 / qps  # İstekler arası planlanan aralık
+            while True:
+                i = claim_index()
+                if i is None:
+                    break
+
+                scheduled_at = start + i * interval  # Kayma birikmesin diye başlangıca göre planlanır
+                if scheduled_at >= deadline:
+                    break
+
+                delay = scheduled_at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+                stats.mark_submitted()
+                executor.submit(execute, i, scheduled_at)
+        else:
+
+            def worker() -> None:
+                while time.perf_counter() < deadline:
+                    i = claim_index()
+                    if i is None:
+                        return
+                    stats.mark_submitted()
+                    execute(i, time.perf_counter())
+
+            for _ in range(concurrency):
+                executor.submit(worker)
+
+    wall_s = time.perf_counter() - start
+    sampler.stop()
+    return stats.records, sampler.samples, wall_s
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Sıralı listeden doğrusal interpolasyonla yüzdelik değer hesaplar."""
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100
+    lower = int(k)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (k - lower)
+
+
+def summarize_latencies(values: List[float]) -> Dict[str, Any]:
+    """Gecikme listesinden rapor istatistikleri (saniye) üretir."""
+    ordered = sorted(values)
+    if not ordered:
+        return {"count": 0}
+
+    return {
+        "count": len(ordered),
+        "mean": round(sum(ordered) / len(ordered), 4),
+        "p50": round(percentile(ordered, 50), 4),
+        "p90": round(percentile(ordered, 90), 4),
+        "p95": round(percentile(ordered, 95), 4),
+        "p99": round(percentile(ordered, 99), 4),
+        "max": round(ordered[-1], 4),
+    }
+
+
+def build_report(
+    records: List[Dict[str, Any]],
+    timeline: List[Dict[str, Any]],
+    wall_s: float,
+    config: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Ham ölçümlerden karşılaştırılabilir JSON raporu üretir.
+
+    Args:
+        records: İstek kayıtları.
+        timeline: Kaynak zaman serisi.
+        wall_s: Testin toplam süresi.
+        config: Test parametreleri (rapora aynen yazılır).
+
+    Returns:
+        Rapor sözlüğü.
+    """
+    ok_records = [r for r in records if r["ok"]]
+    errors_by_type: Dict[str, int] = {}
+
+    for r in records:
+        if not r["ok"]:
+            kind = r["error_kind"] or "unknown"  # "retrieval" veya "generation:<HataTipi>"
+            errors_by_type[kind] = errors_by_type.get(kind, 0) + 1
+
+    rss_values = [s["rss_mb"] for s in timeline if s["rss_mb"] is not None]
+    cpu_values = [s["cpu_percent"] for s in timeline]
+
+    return {
+        "config": config,
+        "summary": {
+            "requests": len(records),
+            "ok": len(ok_records),
+            "errors": len(records) - len(ok_records),
+            "error_rate": round((len(records) - len(ok_records)) / len(records), 4) if records else 0.0,
+            "wall_s": round(wall_s, 3),
+            "throughput_rps": round(len(records) / wall_s, 3) if wall_s > 0 else 0.0,  # Tüm cevaplar
+            "goodput_rps": round(len(ok_records) / wall_s, 3) if wall_s > 0 else 0.0,  # Sadece başarılılar
+            "latency_s": {
+                # Tüm istekler (hatalılar dahil): kapasite planlaması ve karşılaştırma için esas alınır.
+                # Timeout/5xx gibi hatalar genelde en yavaş isteklerdir; dışarıda bırakılırsa kuyruk iyimser görünür.
+                "all_requests": {
+                    "total": summarize_latencies([r["total_s"] for r in records]),
+                    "service": summarize_latencies([r["service_s"] for r in records]),
+                    "queue": summarize_latencies([r["queue_s"] for r in records]),
+                    "retrieval": summarize_latencies([r["retrieval_s"] for r in records]),
+                },
+                # Sadece başarılı istekler: kullanıcının cevap aldığı durumlardaki gecikme
+                "ok_requests": {
+                    "total": summarize_latencies([r["total_s"] for r in ok_records]),
+                    "service": summarize_latencies([r["service_s"] for r in ok_records]),
+                    "queue": summarize_latencies([r["queue_s"] for r in ok_records]),
+                    "retrieval": summarize_latencies([r["retrieval_s"] for r in ok_records]),
+                    "generation": summarize_latencies([r["generation_s"] for r in ok_records]),
+                },
+            },
+            "cpu_percent": {
+                "mean": round(sum(cpu_values) / len(cpu_values), 1) if cpu_values else None,
+                "max": max(cpu_values) if cpu_values else None,
+            },
+            "rss_mb": {
+                "start": rss_values[0] if rss_values else None,
+                "max": max(rss_values) if rss_values else None,
+                "end": rss_values[-1] if rss_values else None,
+            },
+        },
+        "errors_by_type": errors_by_type,
+        "timeline": timeline,
+    }
+
+
+def _round_or_none(value: Optional[float], digits: int) -> Optional[float]:
+    return round(value, digits) if value is not None else None
+
+
+def _git_revision() -> Optional[str]:
+    """Raporu kod sürümüyle eşleştirmek için mevcut commit'i döndürür."""
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=True,
+        )
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None  # Git yoksa rapor yine üretilir
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Cosmetic RAG sorgu pipeline'ı için yük testi")
+
+    parser.add_argument("--queries", default=DEFAULT_QUERIES_PATH, help="Sorgu korpusu (.txt veya .jsonl)")
+    parser.add_argument("--qps", type=float, default=2.0, help="Hedef istek/saniye (<= 0: closed-loop)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Eşzamanlı worker sayısı")
+    parser.add_argument("--duration", type=float, default=None, help="Test süresi (saniye)")
+    parser.add_argument("--num-requests", type=int, default=None, help="Gönderilecek istek sayısı")
+    parser.add_argument("--top-k", type=int, default=5, help="Retrieval sonuç sayısı")
+    parser.add_argument("--sample-interval", type=float, default=1.0, help="CPU/RSS örnekleme aralığı (saniye)")
+    parser.add_argument("--seed", type=int, default=None, help="Sahte gecikmeler için seed")
+
+    parser.add_argument("--backend", choices=["stub", "gemini"], default="stub", help="Gemini yerine yerel stub veya gerçek API")
+    parser.add_argument("--embed-median", type=float, default=0.12, help="Stub embedding medyan gecikmesi (s)")
+    parser.add_argument("--embed-sigma", type=float, default=0.35, help="Stub embedding gecikme dağılımı sigma")
+    parser.add_argument("--embed-error-rate", type=float, default=0.0, help="Stub embedding hata oranı (0-1)")
+    parser.add_argument("--llm-median", type=float, default=2.5, help="Stub LLM medyan gecikmesi (s)")
+    parser.add_argument("--llm-sigma", type=float, default=0.5, help="Stub LLM gecikme dağılımı sigma")
+    parser.add_argument("--llm-error-rate", type=float, default=0.0, help="Stub LLM hata oranı (0-1)")
+    parser.add_argument("--llm-per-1k-chars", type=float, default=0.02, help="Stub LLM'e prompt'un her 1000 karakteri için eklenen gecikme (s)")
+
+    parser.add_argument("--persist-dir", default=None, help="Chroma klasörü (varsayılan: stub için db_loadtest, gemini için db)")
+    parser.add_argument("--collection", default="cosmetics_kb", help="Collection adı")
+    parser.add_argument("--xlsx", default=DEFAULT_XLSX_PATH, help="Stub KB için ürün verisi")
+    parser.add_argument("--skip-index", action="store_true", help="Stub KB'yi yeniden oluşturma")
+    parser.add_argument("--output", default=None, help="Rapor JSON yolu (varsayılan: loadtest_results/...)")
+
+    args = parser.parse_args(argv)
+
+    # Hatalı parametreler, her isteği hata sayan anlamsız bir rapor üretmesin
+    if args.concurrency < 1:
+        parser.error("--concurrency en az 1 olmalıdır.")
+    if args.duration is not None and args.duration <= 0:
+        parser.error("--duration pozitif olmalıdır.")
+    if args.num_requests is not None and args.num_requests < 1:
+        parser.error("--num-requests en az 1 olmalıdır.")
+    if args.sample_interval <= 0:
+        parser.error("--sample-interval pozitif olmalıdır.")
+    for name in ("embed", "llm"):
+        if getattr(args, f"{name}_median") <= 0:
+            parser.error(f"--{name}-median pozitif olmalıdır.")
+        if getattr(args, f"{name}_sigma") < 0:
+            parser.error(f"--{name}-sigma negatif olamaz.")
+        if not 0.0 <= getattr(args, f"{name}_error_rate") <= 1.0:
+            parser.error(f"--{name}-error-rate 0 ile 1 arasında olmalıdır.")
+    if args.llm_per_1k_chars < 0:
+        parser.error("--llm-per-1k-chars negatif olamaz.")
+
+    if args.duration is None and args.num_requests is None:
+        args.duration = 30.0  # Hiçbiri verilmezse makul bir varsayılan
+
+    if args.persist_dir is None:
+        args.persist_dir = "db_loadtest" if args.backend == "stub" else "db"  # Gerçek KB'yi ezmemek için
+
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    queries = load_queries(args.queries)
+
+    restore = None
+    if args.backend == "stub":
+        from tools.fake_gemini import LatencyModel, install_fake_gemini  # Sadece stub modunda gerekli
+
+        embed_latency = LatencyModel(args.embed_median, args.embed_sigma, args.embed_error_rate)
+        llm_latency = LatencyModel(args.llm_median, args.llm_sigma, args.llm_error_rate)
+        if args.seed is not None:
+            embed_latency.seed(args.seed)
+            llm_latency.seed(args.seed + 1)
+
+        restore = install_fake_gemini(embed_latency, llm_latency, args.llm_per_1k_chars)  # Gemini fabrikalarını değiştirir
+
+    else:
+        from dotenv import load_dotenv  # app.py ile aynı şekilde GOOGLE_API_KEY okunur
+
+        load_dotenv()
+
+    try:
+        if args.backend == "stub" and not args.skip_index:
+            ok, msg = build_stub_kb(args.xlsx, args.persist_dir, args.collection)
+            print(msg)
+            if not ok:
+                raise SystemExit(1)
+
+        print(
+            f"Yük testi başlıyor: backend={args.backend} qps={args.qps} concurrency={args.concurrency} "
+            f"duration={args.duration} num_requests={args.num_requests}"
+        )
+        records, timeline, wall_s = run_load_test(
+            queries=queries,
+            qps=args.qps,
+            concurrency=args.concurrency,
+            duration_s=args.duration,
+            num_requests=args.num_requests,
+            persist_dir=args.persist_dir,
+            collection_name=args.collection,
+            top_k=args.top_k,
+            sample_interval_s=args.sample_interval,
+        )
+    finally:
+        if restore is not None:
+            restore()  # Orijinal Gemini fabrikalarını geri koyar
+
+    config = {k: v for k, v in vars(args).items() if k != "output"}  # Karşılaştırma için parametreler
+    config["query_count"] = len(queries)
+    config["git_revision"] = _git_revision()
+    config["started_at"] = datetime.now().isoformat(timespec="seconds")
+
+    report = build_report(records, timeline, wall_s, config)
+
+    output = args.output or os.path.join(
+        "loadtest_results", f"loadtest_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    summary = report["summary"]
+    total = summary["latency_s"]["all_requests"]["total"]  # Hatalılar dahil
+    print(
+        f"İstek: {summary['requests']} | Hata oranı: {summary['error_rate']:.2%} | "
+        f"Throughput: {summary['throughput_rps']} rps | "
+        f"p50/p95/p99 (tüm istekler): {total.get('p50')}/{total.get('p95')}/{total.get('p99')} s | "
+        f"Maks RSS: {summary['rss_mb']['max']} MB"
+    )
+    print(f"Rapor kaydedildi: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Streamlit cold-start profili: import süreleri ve ilk sorgu / kararlı durum sorgu süreleri.
+
+Her import ayrı (temiz) bir Python process'inde ölçülür; böylece sys.modules önbelleği
+sonucu etkilemez. Sorgu ölçümünde Gemini çağrıları varsayılan olarak gecikmesiz yerel
+stub'larla yapılır. İlk sorgunun maliyeti aşamalara ayrılır (chromadb import'u, collection
+açılışı, ilk okuma, HNSW yüklemesi, ilk embedding çağrısı); ardından ısınmış sorgular ölçülür.
+
+Örnek kullanım (repo kökünden):
+    python -m tools.load_test --num-requests 1       # Stub KB'yi (db_loadtest/) oluşturur
+    python -m tools.startup_profile
+    python -m tools.startup_profile --output startup.json
+"""
+
+from __future__ import annotations  # Tip ipuçlarında ileri referans için
+
+import argparse  # Komut satırı parametreleri için
+import json  # Raporu yazdırmak/kaydetmek için
+import os  # Persist klasörünün varlığını kontrol etmek için
+import statistics  # Kararlı durum medyanı için
+import subprocess  # Her import'u temiz process'te ölçmek için
+import sys  # Aynı Python yorumlayıcısını kullanmak için
+import time  # Zamanlama için
+from typing import Any, Dict, List, Optional  # Tipleri açık yazmak için
+
+PROFILED_MODULES: List[str] = [
+    "streamlit",  # Arayüz
+    "dotenv",  # .env okuma
+    "services.rag",  # Retrieval katmanı (chromadb lazy)
+    "services.llm",  # Cevap üretimi (langchain_google_genai lazy)
+    "services.embeddings",  # Embedding katmanı (langchain_google_genai lazy)
+    "chromadb",  # İlk sorguda yüklenen vektör DB
+    "langchain_google_genai",  # İlk sorguda yüklenen Gemini client'ları
+    "services.ingestion",  # Sadece Admin'de yüklenen pandas stack'i
+    "app",  # app.py modül yüklemesi (main() çalışmaz)
+]  # Ölçülecek modüller
+
+_IMPORT_SNIPPET = (
+    "import time, importlib, json\n"
+    "t = time.perf_counter()\n"
+    "importlib.import_module({name!r})\n"
+    "print(json.dumps({{'seconds': time.perf_counter() - t}}))\n"
+)  # Temiz process'te tek import süresini ölçer
+
+
+def measure_import(module_name: str) -> Dict[str, Any]:
+    """
+    Bir modülün import süresini yeni bir Python process'inde ölçer.
+
+    Args:
+        module_name: Import edilecek modül adı.
+
+    Returns:
+        {"module":..., "seconds":..., "error":...}
+    """
+    proc = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SNIPPET.format(name=module_name)],
+        capture_output=True,
+        text=True,
+    )  # Repo kökünden çalıştırıldığında services/app import edilebilir
+
+    if proc.returncode != 0:
+        last_line = (proc.stderr.strip().splitlines() or ["bilinmeyen hata"])[-1]
+        return {"module": module_name, "seconds": None, "error": last_line}  # Eksik bağımlılık vb.
+
+    seconds = json.loads(proc.stdout.strip().splitlines()[-1])["seconds"]
+    return {"module": module_name, "seconds": round(seconds, 4), "error": None}
+
+
+def profile_queries(
+    queries: List[str],
+    persist_dir: str,
+    collection_name: str,
+    use_stub: bool,
+) -> Dict[str, Any]:
+    """
+    İlk sorgunun cold-start maliyetini aşamalara ayırarak ölçer, ardından ısınmış
+    sorguları (ilk ve kararlı durum) karşılaştırır. Aşamalar warmup_collection'ın
+    adımlarıyla aynıdır; toplamı, app.py'deki arka plan ısınmasının kullanıcıdan gizlediği süredir.
+
+    Args:
+        queries: Aşamalardan sonra sırayla çalıştırılacak sorgular.
+        persist_dir: Chroma persist klasörü.
+        collection_name: Collection adı.
+        use_stub: True ise Gemini yerine gecikmesiz yerel modeller kullanılır.
+
+    Returns:
+        Ölçüm sözlüğü.
+    """
+    result: Dict[str, Any] = {"backend": "stub" if use_stub else "gemini"}
+
+    # app.py'nin modül seviyesinde yüklediği servisler; stub'lar bunları import ettiği için önce ölçülür
+    t = time.perf_counter()
+    import services.llm  # noqa: F401
+    from services.embeddings import embed_query
+    from services.rag import get_collection, semantic_search_in_chroma
+
+    result["import_services_s"] = round(time.perf_counter() - t, 4)
+
+    if use_stub:
+        from tools.fake_gemini import LatencyModel, install_fake_gemini
+
+        no_latency = LatencyModel(median_s=1e-6, sigma=0.0)  # Sadece yerel maliyet ölçülsün
+        install_fake_gemini(no_latency, no_latency, llm_per_1k_chars_s=0.0)
+
+    phases: Dict[str, float] = {}  # Aşama adı -> saniye
+
+    t = time.perf_counter()
+    import chromadb  # noqa: F401
+
+    phases["import_chromadb_s"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    collection = get_collection(persist_dir=persist_dir, collection_name=collection_name)  # Client + collection
+    phases["get_collection_s"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    sample = collection.get(limit=1, include=["embeddings"])  # Metadata/SQLite okuma
+    phases["collection_get_s"] = time.perf_counter() - t
+
+    embeddings = sample.get("embeddings")
+    if embeddings is None or len(embeddings) == 0:
+        result["error"] = (
+            f"'{persist_dir}' içindeki '{collection_name}' collection'ı boş; "
+            "boş index HNSW yükleme süresini göstermez."
+        )
+        return result
+
+    t = time.perf_counter()
+    collection.query(query_embeddings=[list(embeddings[0])], n_results=1, include=["distances"])
+    phases["first_collection_query_s"] = time.perf_counter() - t  # HNSW index'inin diskten yüklenmesi
+
+    if not use_stub:
+        t = time.perf_counter()
+        import langchain_google_genai  # noqa: F401
+
+        phases["import_langchain_google_genai_s"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    embed_query(queries[0])  # Stub'da sadece yerel maliyet; Gemini'de client oluşturma + ağ çağrısı
+    phases["first_embed_query_s"] = time.perf_counter() - t
+
+    result["cold_start_phases_s"] = {k: round(v, 4) for k, v in phases.items()}
+    result["cold_start_total_s"] = round(sum(phases.values()), 4)
+
+    timings: List[float] = []  # Isınmış pipeline'da her sorgunun süresi
+    for query in queries:
+        t = time.perf_counter()
+        ok, msg, _ = semantic_search_in_chroma(
+            query_text=query,
+            persist_dir=persist_dir,
+            collection_name=collection_name,
+        )
+        timings.append(time.perf_counter() - t)
+        if not ok:
+            result["error"] = msg  # Eksik KB vb. durumları raporda gösterir
+            break
+
+    if timings:
+        result["first_query_after_warmup_s"] = round(timings[0], 4)
+    if len(timings) > 1:
+        result["steady_query_median_s"] = round(statistics.median(timings[1:]), 4)
+
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Cold-start ve ilk sorgu profili")
+    parser.add_argument("--persist-dir", default=None, help="Chroma klasörü (varsayılan: stub için db_loadtest, gemini için db)")
+    parser.add_argument("--collection", default="cosmetics_kb", help="Collection adı")
+    parser.add_argument("--repeats", type=int, default=10, help="Kararlı durum için sorgu sayısı")
+    parser.add_argument("--backend", choices=["stub", "gemini"], default="stub", help="Gemini yerine yerel stub veya gerçek API")
+    parser.add_argument("--output", default=None, help="Raporun kaydedileceği JSON yolu")
+    args = parser.parse_args(argv)
+
+    if args.persist_dir is None:
+        args.persist_dir = "db_loadtest" if args.backend == "stub" else "db"  # Stub vektörleri gerçek KB ile eşleşmez
+
+    if not os.path.isdir(args.persist_dir):
+        # get_or_create_collection boş bir KB oluşturup onu ölçerdi
+        raise SystemExit(
+            f"Chroma klasörü bulunamadı: {args.persist_dir}. "
+            "Stub KB için önce 'python -m tools.load_test --num-requests 1' çalıştırın."
+        )
+
+    imports = [measure_import(name) for name in PROFILED_MODULES]  # Modül bazında import maliyeti
+
+    if args.backend == "gemini":
+        from dotenv import load_dotenv
+
+        load_dotenv()  # app.py ile aynı şekilde GOOGLE_API_KEY okunur
+
+    queries = ["Kuru cilt için nemlendirici önerir misin?"] * (args.repeats + 1)  # Aynı sorgu: sadece sıcaklık farkı
+    query_profile = profile_queries(
+        queries=queries,
+        persist_dir=args.persist_dir,
+        collection_name=args.collection,
+        use_stub=args.backend == "stub",
+    )
+
+    report = {"imports": imports, "queries": query_profile}
+
+    for item in imports:
+        value = f"{item['seconds']:.3f} s" if item["seconds"] is not None else f"HATA: {item['error']}"
+        print(f"import {item['module']:<24} {value}")
+    print(json.dumps(query_profile, ensure_ascii=False, indent=2))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"Rapor kaydedildi: {args.output}")
+
+    if "error" in query_profile:
+        raise SystemExit(f"Profil geçersiz: {query_profile['error']}")  # Anlamsız sonucu başarı gibi göstermez
+
+
+if __name__ == "__main__":
+    main()